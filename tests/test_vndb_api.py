@@ -0,0 +1,46 @@
+"""Tests for VNDBClient.resolve."""
+
+import tempfile
+import unittest
+from unittest import mock
+
+from vn_tracker.core.vndb_api import VNDBClient
+
+
+class ResolveTest(unittest.TestCase):
+    """resolve() must not fall back to a title search when the entry is known."""
+    
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.client = VNDBClient(cache_dir.name)
+        self.stored = {"id": "v17", "title": "Ever17", "image": {"url": "https://example.invalid/v17.jpg"}}
+    
+    def _resolve(self, vndb_id):
+        response = mock.Mock(content=b"cover")
+        with mock.patch.object(self.client, "fetch_vn_details") as title_search, \
+                mock.patch.object(self.client, "fetch_vn_by_id") as fetch_by_id, \
+                mock.patch("vn_tracker.core.vndb_api.requests.get", return_value=response) as download:
+            result = self.client.resolve("Ever17", vndb_id, self.stored)
+        return result, title_search, fetch_by_id, download
+    
+    def test_stored_data_matching_title_with_id_skips_title_search(self):
+        (vn_info, image), title_search, fetch_by_id, download = self._resolve("v17")
+        
+        title_search.assert_not_called()
+        fetch_by_id.assert_not_called()
+        download.assert_called_once_with("https://example.invalid/v17.jpg", timeout=10)
+        self.assertIs(vn_info, self.stored)
+        self.assertEqual(image, b"cover")
+    
+    def test_stored_data_without_id_skips_title_search(self):
+        (vn_info, image), title_search, fetch_by_id, _ = self._resolve(None)
+        
+        title_search.assert_not_called()
+        fetch_by_id.assert_not_called()
+        self.assertIs(vn_info, self.stored)
+        self.assertEqual(image, b"cover")
+
+
+if __name__ == "__main__":
+    unittest.main()
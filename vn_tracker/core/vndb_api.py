@@ -4,9 +4,10 @@ import requests
 import os
 import urllib.parse
 import json
+import threading
 from PIL import Image
 from io import BytesIO
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 VNDB_API_URL = "https://api.vndb.org/kana/vn"
 
@@ -18,6 +19,10 @@ class VNDBClient:
         self.image_cache_dir = image_cache_dir
         self.vn_data: Dict[str, Any] = {}
         self.image_cache: Dict[str, Any] = {}
+        self.resolved_info: Dict[str, Dict[str, Any]] = {}  # title -> info from resolve()
+        # Pool workers (VN info loads, cover prefetch) share this client; every
+        # cache mutation, cache-file save and cover write happens under this lock
+        self._lock = threading.RLock()
         os.makedirs(image_cache_dir, exist_ok=True)
         
         # Persistent VN data cache file
@@ -30,8 +35,9 @@ class VNDBClient:
             if os.path.exists(self.vn_data_cache_file):
                 with open(self.vn_data_cache_file, 'r', encoding='utf-8') as f:
                     cached_data = json.load(f)
+                with self._lock:
                     self.vn_data.update(cached_data)
-                    print(f"Loaded {len(cached_data)} VN entries from cache")
+                print(f"Loaded {len(cached_data)} VN entries from cache")
             else:
                 print("No VN data cache file found")
         except Exception as e:
@@ -39,12 +45,16 @@ class VNDBClient:
     
     def save_vn_data_cache(self):
         """Save VN data to persistent cache file."""
-        try:
-            with open(self.vn_data_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.vn_data, f, ensure_ascii=False, indent=2)
+        with self._lock:
+            try:
+                # Write a temp file and swap it in so the cache is never torn
+                tmp_file = self.vn_data_cache_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.vn_data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, self.vn_data_cache_file)
                 print(f"Saved {len(self.vn_data)} VN entries to cache")
-        except Exception as e:
-            print(f"Error saving VN data cache: {e}")
+            except Exception as e:
+                print(f"Error saving VN data cache: {e}")
     
     def search_vn(self, query: str = "", limit: int = 50) -> List[Dict[str, Any]]:
         """Search for visual novels and return list of VN data with IDs."""
@@ -73,16 +83,17 @@ class VNDBClient:
             
             # Store VN data for later use (by both title and ID)
             results = data.get("results", [])
-            for item in results:
-                # Store by title for backward compatibility
-                self.vn_data[item["title"]] = item
-                # Also store by ID for precise lookups
-                if "id" in item:
-                    self.vn_data[f"id:{item['id']}"] = item
-            
-            # Save to persistent cache
-            if results:
-                self.save_vn_data_cache()
+            with self._lock:
+                for item in results:
+                    # Store by title for backward compatibility
+                    self.vn_data[item["title"]] = item
+                    # Also store by ID for precise lookups
+                    if "id" in item:
+                        self.vn_data[f"id:{item['id']}"] = item
+                
+                # Save to persistent cache
+                if results:
+                    self.save_vn_data_cache()
             
             # Prioritize exact matches in results
             if query.strip():
@@ -136,9 +147,10 @@ class VNDBClient:
             if results:
                 vn_data = results[0]  # Should be exactly one result for ID lookup
                 # Store by both ID and title
-                self.vn_data[f"id:{vndb_id}"] = vn_data
-                self.vn_data[vn_data["title"]] = vn_data
-                self.save_vn_data_cache()
+                with self._lock:
+                    self.vn_data[f"id:{vndb_id}"] = vn_data
+                    self.vn_data[vn_data["title"]] = vn_data
+                    self.save_vn_data_cache()
                 return vn_data
             else:
                 print(f"No VN found with ID '{vndb_id}'")
@@ -194,11 +206,7 @@ class VNDBClient:
                 for result in results:
                     if result.get("title", "").lower() == title.lower():
                         print(f"Found exact match for '{title}': {result.get('title')} (ID: {result.get('id')})")
-                        # Store by both title and ID
-                        self.vn_data[title] = result
-                        if "id" in result:
-                            self.vn_data[f"id:{result['id']}"] = result
-                        self.save_vn_data_cache()
+                        self._store_title_result(title, result)
                         return result
                 
                 # If no exact match, look for partial match
@@ -206,21 +214,13 @@ class VNDBClient:
                     result_title = result.get("title", "").lower()
                     if title.lower() in result_title or result_title in title.lower():
                         print(f"Found partial match for '{title}': {result.get('title')} (ID: {result.get('id')})")
-                        # Store by both title and ID
-                        self.vn_data[title] = result
-                        if "id" in result:
-                            self.vn_data[f"id:{result['id']}"] = result
-                        self.save_vn_data_cache()
+                        self._store_title_result(title, result)
                         return result
                 
                 # If still no good match, return first result but warn
                 print(f"Using first result for '{title}': {results[0].get('title')} (ID: {results[0].get('id')}) - may not be exact")
                 vn_info = results[0]
-                # Store by both title and ID
-                self.vn_data[title] = vn_info
-                if "id" in vn_info:
-                    self.vn_data[f"id:{vn_info['id']}"] = vn_info
-                self.save_vn_data_cache()
+                self._store_title_result(title, vn_info)
                 return vn_info
             else:
                 print(f"No results found for '{title}'")
@@ -236,6 +236,49 @@ class VNDBClient:
             traceback.print_exc()
             return None
     
+    def _store_title_result(self, title: str, vn_info: Dict[str, Any]) -> None:
+        """Cache a title search result by both title and ID, and persist it."""
+        with self._lock:
+            self.vn_data[title] = vn_info
+            if "id" in vn_info:
+                self.vn_data[f"id:{vn_info['id']}"] = vn_info
+            self.save_vn_data_cache()
+    
+    def resolve(self, title: str, vndb_id: Optional[str] = None,
+                stored_data: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Resolve VN info and cover image bytes for a title in one pass.
+        
+        Lookups go from cheapest to most expensive: memoized result, cached data
+        by ID, data stored with the library entry, fetch by ID, cached data by
+        title, and finally a fetch by title. Data found by ID or stored with the
+        entry is also cached under the library title for get_cover_image.
+        """
+        if not title:
+            return None, None
+        
+        vn_info = self.resolved_info.get(title)
+        if not vn_info:
+            if vndb_id:
+                vn_info = self.get_vn_data_by_id(vndb_id) or stored_data or self.fetch_vn_by_id(vndb_id)
+            else:
+                vn_info = stored_data
+            
+            # Covers are looked up by library title, so map it to data found by
+            # ID or stored with the entry; otherwise get_cover_image would fall
+            # back to a title search and could cache the wrong cover
+            if vn_info:
+                with self._lock:
+                    if title not in self.vn_data or vn_info.get("title") != title:
+                        self.vn_data[title] = vn_info
+            else:
+                vn_info = self.get_vn_data(title) or self.fetch_vn_details(title)
+            
+            if vn_info:
+                with self._lock:
+                    self.resolved_info[title] = vn_info
+        
+        return vn_info, self.get_cover_image(title)
+    
     def get_cover_image(self, title: str) -> Optional[Any]:
         """Get cover image for a VN title."""
         if not title:
@@ -255,9 +298,10 @@ class VNDBClient:
             try:
                 with open(image_path, "rb") as f:
                     image_data = f.read()  # Return raw bytes for PyQt5
-                    # Cache in memory for future use
+                # Cache in memory for future use
+                with self._lock:
                     self.image_cache[image_path] = image_data
-                    return image_data
+                return image_data
             except Exception as e:
                 print(f"Cache image loading error: {e}")
         
@@ -289,12 +333,14 @@ class VNDBClient:
             response.raise_for_status()
             img_data = response.content
             
-            # Cache on disk
-            with open(image_path, "wb") as f:
-                f.write(img_data)
-            
-            # Cache in memory
-            self.image_cache[image_path] = img_data
+            # Cache on disk via a temp file, so a concurrent reader never sees
+            # a partly written cover, and in memory
+            with self._lock:
+                tmp_path = image_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(img_data)
+                os.replace(tmp_path, image_path)
+                self.image_cache[image_path] = img_data
             
             print(f"Successfully downloaded and cached image for '{title}'")
             # Return raw bytes for PyQt5
@@ -308,8 +354,10 @@ class VNDBClient:
     
     def clear_cache(self) -> None:
         """Clear the image and VN data cache."""
-        self.image_cache.clear()
-        self.vn_data.clear()
+        with self._lock:
+            self.image_cache.clear()
+            self.vn_data.clear()
+            self.resolved_info.clear()
         
         # Also clear persistent cache
         try:
@@ -323,17 +371,20 @@ class VNDBClient:
     
     def clear_vn_cache(self, title: str) -> None:
         """Clear cached data for a specific VN title."""
-        if title in self.vn_data:
-            del self.vn_data[title]
-            print(f"Cleared cached data for '{title}'")
-            # Save updated cache
-            self.save_vn_data_cache()
-        
-        # Also clear image cache for this title
-        image_path = os.path.join(
-            self.image_cache_dir, 
-            f"{urllib.parse.quote(title, safe='')}.jpg"
-        )
-        if image_path in self.image_cache:
-            del self.image_cache[image_path]
-            print(f"Cleared cached image for '{title}'")
+        with self._lock:
+            self.resolved_info.pop(title, None)
+            
+            if title in self.vn_data:
+                del self.vn_data[title]
+                print(f"Cleared cached data for '{title}'")
+                # Save updated cache
+                self.save_vn_data_cache()
+            
+            # Also clear image cache for this title
+            image_path = os.path.join(
+                self.image_cache_dir, 
+                f"{urllib.parse.quote(title, safe='')}.jpg"
+            )
+            if image_path in self.image_cache:
+                del self.image_cache[image_path]
+                print(f"Cleared cached image for '{title}'")
@@ -7,12 +7,17 @@ import atexit
 import faulthandler
 import traceback
 import ctypes
+from pathlib import Path
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPixmapCache
 
 # Application version
 APP_VERSION = "1.1.3"
 
+# Periodic memory check, installed by the Windows setup below if available
+_memory_check_callback = None
+
 # Windows-specific crash prevention
 if sys.platform == "win32":
     try:
@@ -68,48 +73,43 @@ if sys.platform == "win32":
 from .ui.main_window_qt import VNTrackerMainWindow
 from .utils.crash_logger import CrashLogger
 
+# Precomputed at import so fix_taskbar_icon does no string building per call
+_APPUSERMODEL_ID = f'vnclub.vntracker.timetracker.{APP_VERSION}'
+_PKG_DIR = Path(__file__).resolve().parent
+_ICON_DIRS = (_PKG_DIR.parent / "icons", Path("icons"), Path("."))
+_ICON_CANDIDATES = tuple(
+    d / name for d in _ICON_DIRS for name in ("app_icon.png", "app_icon.ico")
+)
+
 def fix_taskbar_icon(app):
     """Fix taskbar icon issue on Windows by setting application ID and icon."""
     try:
-        import os
         from PyQt5.QtGui import QIcon
         
         # Windows-specific fix for taskbar icon
         if sys.platform == "win32":
             try:
                 # Set unique application ID to separate from Python interpreter
-                import ctypes
-                myappid = f'vnclub.vntracker.timetracker.{APP_VERSION}'  # Unique app ID
-                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-                print(f"Set Windows application ID: {myappid}")
+                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(_APPUSERMODEL_ID)
+                print(f"Set Windows application ID: {_APPUSERMODEL_ID}")
             except Exception as e:
                 print(f"Could not set Windows application ID: {e}")
         
-        # Try to load and set application icon
-        icon_paths = [
-            os.path.join(os.path.dirname(__file__), "..", "icons", "app_icon.png"),
-            os.path.join(os.path.dirname(__file__), "..", "icons", "app_icon.ico"),
-            os.path.join("icons", "app_icon.png"),
-            os.path.join("icons", "app_icon.ico"),
-            "app_icon.png",
-            "app_icon.ico"
-        ]
-        
-        icon_set = False
-        for icon_path in icon_paths:
-            if os.path.exists(icon_path):
-                try:
-                    icon = QIcon(icon_path)
-                    if not icon.isNull():
-                        app.setWindowIcon(icon)
-                        print(f"Set application icon from: {icon_path}")
-                        icon_set = True
-                        break
-                except Exception as e:
-                    print(f"Error setting icon from {icon_path}: {e}")
+        # Try to load and set application icon; a file that doesn't load
+        # falls through to the next candidate
+        for icon_path in _ICON_CANDIDATES:
+            if not icon_path.is_file():
+                continue
+            try:
+                icon = QIcon(str(icon_path))
+                if not icon.isNull():
+                    app.setWindowIcon(icon)
+                    print(f"Set application icon from: {icon_path}")
+                    return
+            except Exception as e:
+                print(f"Error setting icon from {icon_path}: {e}")
         
-        if not icon_set:
-            print("No application icon found, will use programmatic icon")
+        print("No application icon found, using the default Qt icon")
             
     except Exception as e:
         print(f"Error in fix_taskbar_icon: {e}")
@@ -118,8 +118,12 @@ def fix_taskbar_icon(app):
 _app_instance = None
 _main_window = None
 
-def emergency_shutdown():
-    """Emergency shutdown procedure with enhanced safety."""
+def emergency_shutdown(_os=os):
+    """Emergency shutdown procedure with enhanced safety.
+    
+    ``os`` is bound as a default argument so the last-resort exit still works
+    if module globals are being torn down during interpreter shutdown.
+    """
     try:
         print("Emergency shutdown initiated...")
         
@@ -135,6 +139,13 @@ def emergency_shutdown():
             except Exception as e:
                 print(f"Emergency data save failed: {e}")
         
+        # Write out a config save still waiting on the (daemon) schedule_save timer
+        if _main_window and getattr(_main_window, 'config_manager', None):
+            try:
+                _main_window.config_manager.flush()
+            except Exception as e:
+                print(f"Emergency config save failed: {e}")
+        
         # Stop tracker if available
         if _main_window and hasattr(_main_window, 'tracker'):
             try:
@@ -154,8 +165,7 @@ def emergency_shutdown():
     except Exception as e:
         print(f"Emergency shutdown error: {e}")
         # Last resort - force exit
-        import os
-        os._exit(1)
+        _os._exit(1)
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
@@ -167,8 +177,7 @@ def main() -> None:
     """Main application entry point."""
     global _app_instance, _main_window
     
-    # Register emergency handlers
-    atexit.register(emergency_shutdown)
+    # Register emergency handlers (atexit is registered once the window exists)
     signal.signal(signal.SIGINT, signal_handler)
     if hasattr(signal, 'SIGTERM'):
         signal.signal(signal.SIGTERM, signal_handler)
@@ -213,6 +222,9 @@ def main() -> None:
         
         _app_instance = QApplication(sys.argv)
         
+        # One budget for every cached pixmap (covers, placeholders) in the app
+        QPixmapCache.setCacheLimit(32 * 1024)  # KB
+        
         # Detect and adjust for high DPI displays
         try:
             from PyQt5.QtWidgets import QDesktopWidget
@@ -252,7 +264,6 @@ def main() -> None:
             except Exception as e:
                 print(f"Exception handler failed: {e}")
                 # Force exit as last resort
-                import os
                 os._exit(1)
         
         sys.excepthook = qt_exception_handler
@@ -261,10 +272,11 @@ def main() -> None:
         try:
             _main_window = VNTrackerMainWindow(config_file, log_file, image_cache_dir, crash_logger)
             _main_window.show()
+            atexit.register(emergency_shutdown)
             crash_logger.log_info("Main window created successfully")
             
             # Setup memory monitoring if available
-            if '_memory_check_callback' in locals() and _memory_check_callback:
+            if _memory_check_callback:
                 memory_timer = QTimer()
                 memory_timer.timeout.connect(_memory_check_callback)
                 memory_timer.start(30000)  # Check every 30 seconds
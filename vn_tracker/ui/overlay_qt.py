@@ -2,7 +2,10 @@
 
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QPainter, QColor
+from PyQt5.QtGui import QFont, QPainter, QColor, QPen, QBrush
+
+# Fixed border pen, built once instead of on every paint
+_BORDER_PEN = QPen(QColor(100, 100, 100, 150))
 
 
 class OverlayWindow(QWidget):
@@ -12,6 +15,7 @@ class OverlayWindow(QWidget):
         super().__init__(parent)
         # Default color configuration
         self._bg_color = QColor(30, 30, 30, 200)
+        self._bg_brush = QBrush(self._bg_color)
         self._text_color = QColor(255, 255, 255)
         self.setup_ui()
     
@@ -82,6 +86,7 @@ class OverlayWindow(QWidget):
         
         # Initial size and position
         self.setFixedSize(120, 35)
+        self._bg_rect = self.rect().adjusted(2, 2, -2, -2)
         self.move(20, 20)
     
     def update_time(self, time_str: str):
@@ -108,13 +113,17 @@ class OverlayWindow(QWidget):
         """Draw overlay background with robust painter handling."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        rect = self.rect().adjusted(2, 2, -2, -2)
-        painter.setBrush(self._bg_color)
-        painter.setPen(QColor(100, 100, 100, 150))
-        painter.drawRoundedRect(rect, 6, 6)
+        painter.setBrush(self._bg_brush)
+        painter.setPen(_BORDER_PEN)
+        painter.drawRoundedRect(self._bg_rect, 6, 6)
         painter.end()
         super().paintEvent(event)
     
+    def resizeEvent(self, event):
+        """Recompute the background rect only when the size changes."""
+        self._bg_rect = self.rect().adjusted(2, 2, -2, -2)
+        super().resizeEvent(event)
+    
     def set_alpha(self, alpha: float):
         """Set overlay transparency."""
         self.setWindowOpacity(alpha)
@@ -170,6 +179,7 @@ class OverlayWindow(QWidget):
             color_changed = False
             if new_bg_color and new_bg_color != self._bg_color:
                 self._bg_color = new_bg_color
+                self._bg_brush = QBrush(new_bg_color)
                 color_changed = True
                 
             if new_text_color and new_text_color != self._text_color:
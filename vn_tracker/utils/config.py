@@ -1,5 +1,6 @@
 """Configuration management utilities."""
 
+import copy
 import json
 import os
 import threading
@@ -16,11 +17,16 @@ class ConfigManager:
         self.config_file = config_file
         self._config: Dict[str, Any] = {}
         self._lock = threading.RLock()  # Reentrant lock for config access
+        self._write_lock = threading.Lock()  # Keeps file writes in snapshot order
+        self._library_vns: Optional[List[str]] = None  # Cached get_all_library_vns result
+        self._library_vns_set: Optional[frozenset] = None
+        self._save_timer: Optional[threading.Timer] = None  # Pending schedule_save write
         self.load()
     
     def load(self) -> None:
         """Load configuration from file."""
         with self._lock:
+            self._invalidate_library()
             try:
                 if os.path.exists(self.config_file):
                     with open(self.config_file, "r", encoding="utf-8") as f:
@@ -32,14 +38,41 @@ class ConfigManager:
                 self._config = {}
     
     def save(self) -> None:
-        """Save configuration to file."""
-        with self._lock:
+        """Save configuration to file.
+        
+        The config is serialized from a snapshot taken under the lock, then
+        written to a temp file that replaces config.json, so a save from the
+        schedule_save timer thread can neither see a half-changed config nor
+        leave a truncated file behind.
+        """
+        with self._write_lock:
             try:
-                with open(self.config_file, "w", encoding="utf-8") as f:
-                    json.dump(self._config, f, indent=2, ensure_ascii=False)
+                with self._lock:
+                    text = json.dumps(copy.deepcopy(self._config), indent=2, ensure_ascii=False)
+                tmp_file = self.config_file + ".tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_file, self.config_file)
             except Exception as e:
                 print(f"Configuration save error: {e}")
     
+    def schedule_save(self, delay: float = 0.5) -> None:
+        """Save on a background thread after a short delay, coalescing repeated calls."""
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write out a save still pending from schedule_save, if any."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer:
+            timer.cancel()
+            self.save()  # Outside _lock: save() takes _write_lock first
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         with self._lock:
@@ -49,11 +82,18 @@ class ConfigManager:
         """Set configuration value."""
         with self._lock:
             self._config[key] = value
+            self._invalidate_library()
     
     def update(self, data: Dict[str, Any]) -> None:
         """Update multiple configuration values."""
         with self._lock:
             self._config.update(data)
+            self._invalidate_library()
+    
+    def _invalidate_library(self) -> None:
+        """Drop the cached library listing after a config change."""
+        self._library_vns = None
+        self._library_vns_set = None
     
     @property
     def data(self) -> Dict[str, Any]:
@@ -113,7 +153,7 @@ class ConfigManager:
     def add_manual_vn(self, title: str) -> None:
         """Add a manually registered VN to the list."""
         if title and title.strip():
-            manual_vns = self.manual_vns
+            manual_vns = list(self.manual_vns)
             title = title.strip()
             if title not in manual_vns:
                 manual_vns.append(title)
@@ -124,7 +164,7 @@ class ConfigManager:
         """Add a VN from VNDB with its ID and metadata."""
         if title and title.strip() and vndb_id:
             title = title.strip()
-            vndb_vns = self.vndb_vns
+            vndb_vns = dict(self.vndb_vns)
             
             vndb_vns[title] = {
                 "vndb_id": vndb_id,
@@ -151,7 +191,7 @@ class ConfigManager:
     def remove_manual_vn(self, title: str) -> None:
         """Remove a manually registered VN from the list."""
         if title and title.strip():
-            manual_vns = self.manual_vns
+            manual_vns = list(self.manual_vns)
             title = title.strip()
             if title in manual_vns:
                 manual_vns.remove(title)
@@ -162,7 +202,7 @@ class ConfigManager:
         """Remove a VNDB VN from the list."""
         if title and title.strip():
             title = title.strip()
-            vndb_vns = self.vndb_vns
+            vndb_vns = dict(self.vndb_vns)
             
             if title in vndb_vns:
                 del vndb_vns[title]
@@ -171,11 +211,23 @@ class ConfigManager:
 
     def get_all_library_vns(self) -> List[str]:
         """Get all VNs in the library (manual + VNDB + from process mapping)."""
-        all_vns = set()
-        all_vns.update(self.manual_vns)
-        all_vns.update(self.vndb_vns.keys())
-        all_vns.update(self.process_to_vn.keys())
-        return sorted(list(all_vns))
+        with self._lock:
+            if self._library_vns is None:
+                all_vns = set()
+                all_vns.update(self.manual_vns)
+                all_vns.update(self.vndb_vns.keys())
+                all_vns.update(self.process_to_vn.keys())
+                self._library_vns_set = frozenset(all_vns)
+                self._library_vns = sorted(all_vns)
+            return list(self._library_vns)
+    
+    @property
+    def library_vns_set(self) -> frozenset:
+        """Get the library titles as a set for membership checks."""
+        with self._lock:
+            if self._library_vns_set is None:
+                self.get_all_library_vns()
+            return self._library_vns_set
 
     def remove_vn_completely(self, title: str) -> None:
         """Remove a VN completely from manual_vns, vndb_vns, and process_to_vn mapping."""
@@ -184,21 +236,21 @@ class ConfigManager:
             changes_made = False
             
             # Remove from manual VNs if it exists there
-            manual_vns = self.manual_vns
+            manual_vns = list(self.manual_vns)
             if title in manual_vns:
                 manual_vns.remove(title)
                 self.update({"manual_vns": manual_vns})
                 changes_made = True
             
             # Remove from VNDB VNs if it exists there
-            vndb_vns = self.vndb_vns
+            vndb_vns = dict(self.vndb_vns)
             if title in vndb_vns:
                 del vndb_vns[title]
                 self.update({"vndb_vns": vndb_vns})
                 changes_made = True
             
             # Remove from process mapping if it exists there
-            process_mapping = self.process_to_vn
+            process_mapping = dict(self.process_to_vn)
             if title in process_mapping:
                 del process_mapping[title]
                 self.update({"process_to_vn": process_mapping})
@@ -13,6 +13,8 @@ class I18nManager:
         self.current_language = config_manager.get("language", "en")  # Default to English
         self.translations: Dict[str, Dict[str, str]] = {}
         self._load_translations()
+        # Table for the active language, so t() is a single dict lookup
+        self._table: Dict[str, str] = self.translations.get(self.current_language, {})
     
     def _load_translations(self) -> None:
         """Load translation dictionaries."""
@@ -193,6 +195,7 @@ class I18nManager:
         """Set current language."""
         if language in self.translations:
             self.current_language = language
+            self._table = self.translations[language]
             self.config_manager.set("language", language)
             self.config_manager.save()
     
@@ -205,7 +208,7 @@ class I18nManager:
     
     def t(self, key: str, **kwargs) -> str:
         """Translate a key to current language with optional formatting."""
-        text = self.translations.get(self.current_language, {}).get(key, key)
+        text = self._table.get(key, key)
         if kwargs:
             try:
                 return text.format(**kwargs)
@@ -4,6 +4,7 @@ import win32gui
 import win32process
 import win32api
 import psutil
+import functools
 from typing import Optional
 from datetime import datetime
 
@@ -56,8 +57,9 @@ def get_running_processes() -> list[str]:
     return sorted(list(names))
 
 
+@functools.lru_cache(maxsize=128)
 def format_time(seconds: int) -> str:
-    """Format seconds into HH:MM:SS string."""
+    """Format seconds into HH:MM:SS string (memoized; called on every display tick)."""
     hrs = seconds // 3600
     mins = (seconds % 3600) // 60
     secs = seconds % 60